@@ -1,12 +1,15 @@
 """The BeHome integration."""
-import asyncio
+from collections import deque
+from collections.abc import Callable, Iterable
 from datetime import timedelta
+import logging
 import time
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import config_entry_oauth2_flow, area_registry, config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
@@ -18,82 +21,202 @@ from .const import (
     OAUTH2_TOKEN_URL,
 )
 from .api import BemfaAPI
+from .util import normalize_room
+
+_LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=5)
 
+# Commands within this window share one poll, so a command is polled 0-3 s later
+DELAYED_REFRESH_COOLDOWN = 3.0
+
 # This integration can only be configured via config entries
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
-class DummyLogger:
-    """A dummy logger that does nothing but satisfies the coordinator's requirements."""
-    
-    def isEnabledFor(self, level):
-        return False
-    
-    def debug(self, *args, **kwargs):
-        pass
-    
-    def info(self, *args, **kwargs):
-        pass
-    
-    def warning(self, *args, **kwargs):
-        pass
-    
-    def error(self, *args, **kwargs):
-        pass
-
-
 class SmartDataUpdateCoordinator(DataUpdateCoordinator):
     """Smart coordinator that avoids duplicate refreshes."""
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._last_manual_refresh = 0
+        self._last_manual_refresh = float("-inf")  # monotonic clock may start near 0
         self._manual_refresh_cooldown = 8  # Increased to 8 seconds
-        self._locked_devices = {}  # deviceID -> lock_end_time
+        self._force_refresh = False  # Set for a scheduled post-command refresh
+        self._locked_devices = {}  # deviceID -> latest lock_end_time
+        self._lock_expiries = deque()  # (lock_end_time, deviceID), oldest first
         self._device_lock_duration = 5  # Lock device state for 5 seconds
+        self._delayed_refresh = Debouncer(
+            self.hass,
+            self.logger,
+            cooldown=DELAYED_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_handle_scheduled_refresh,
+        )
+        self.data_by_device_id: dict[str, dict] = {}
+        self.data_by_type: dict[str, list[dict]] = {}
+        # Devices in the order they were first seen, for platform discovery
+        self._device_log: list[dict] = []
+        self._known_device_ids: set[str] = set()
+        # Platform discovery callbacks by device type, fed by one listener
+        self._platform_callbacks: dict[str, list[Callable[[list[dict]], None]]] = {}
+        self._remove_dispatcher: CALLBACK_TYPE | None = None
+        self._dispatch_token = 0
 
-    def update_device_state_immediately(self, device_id: str, new_state: dict):
+    def update_device_state_immediately(
+        self, device_id: str, new_state: dict, notify: bool = True
+    ):
         """Update device state immediately in local cache and lock it."""
+        self.update_device_states_immediately({device_id: new_state}, notify)
+
+    def update_device_states_immediately(
+        self, updates: dict[str, dict], notify: bool = True
+    ):
+        """Update several device states in local cache and lock them.
+
+        Listeners are notified once for the whole batch. Pass notify=False
+        when the caller writes the affected entity's state itself.
+        """
         if not self.data:
             return
 
-        # Lock this device state to prevent overwrite by polling
-        self._locked_devices[device_id] = time.time() + self._device_lock_duration
+        lock_end_time = time.monotonic() + self._device_lock_duration
+        for device_id, new_state in updates.items():
+            # Lock this device state to prevent overwrite by polling
+            self._locked_devices[device_id] = lock_end_time
+            self._lock_expiries.append((lock_end_time, device_id))
 
-        # Find and update the device in the cached data
-        for device in self.data:
-            if device.get("deviceID") == device_id:
+            # Update the device in the cached data
+            device = self.data_by_device_id.get(device_id)
+            if device is not None:
                 device.update(new_state)
-                break
 
         # Notify all listeners about the state change
-        self.async_update_listeners()
-        
-    async def async_request_refresh_after_delay(self, delay: float = 3.0):
-        """Request refresh after delay, avoiding conflicts with regular polling."""
-        await asyncio.sleep(delay)
-        self._last_manual_refresh = time.time()
-        await self.async_request_refresh()
+        if notify:
+            self.async_update_listeners()
         
+    @callback
+    def new_devices_since(self, token: int) -> tuple[list[dict], int]:
+        """Return devices first seen after token and the token for next time.
+
+        Pass 0 to get every device seen so far.
+        """
+        device_log = self._device_log
+        return device_log[token:], len(device_log)
+
+    @callback
+    def async_register_platform(
+        self,
+        device_types: Iterable[str],
+        async_add_devices: Callable[[list[dict]], None],
+    ) -> CALLBACK_TYPE:
+        """Report devices of the given types to a platform as they first appear.
+
+        async_add_devices is called right away with the matching devices seen
+        so far, then after each refresh that finds new ones. Returns a
+        callable that stops the reports.
+        """
+        device_types = frozenset(device_types)
+
+        # Catch up on devices the dispatcher handed out before registration
+        devices = [
+            device
+            for device in self._device_log[:self._dispatch_token]
+            if device["id"] in device_types
+        ]
+        if devices:
+            async_add_devices(devices)
+
+        for device_type in device_types:
+            self._platform_callbacks.setdefault(device_type, []).append(
+                async_add_devices
+            )
+        # A single listener serves every platform, whatever its device count
+        if self._remove_dispatcher is None:
+            self._remove_dispatcher = self.async_add_listener(
+                self._async_dispatch_new_devices
+            )
+        self._async_dispatch_new_devices()
+
+        @callback
+        def _async_unregister() -> None:
+            for device_type in device_types:
+                callbacks = self._platform_callbacks[device_type]
+                callbacks.remove(async_add_devices)
+                if not callbacks:
+                    del self._platform_callbacks[device_type]
+            if not self._platform_callbacks and self._remove_dispatcher:
+                self._remove_dispatcher()
+                self._remove_dispatcher = None
+
+        return _async_unregister
+
+    @callback
+    def _async_dispatch_new_devices(self) -> None:
+        """Hand newly seen devices to the platforms registered for their type."""
+        devices, self._dispatch_token = self.new_devices_since(self._dispatch_token)
+        if not devices:
+            return
+
+        platform_callbacks = self._platform_callbacks
+        by_type: dict[str, list[dict]] = {}
+        for device in devices:
+            if device["id"] in platform_callbacks:
+                by_type.setdefault(device["id"], []).append(device)
+
+        for device_type, type_devices in by_type.items():
+            for async_add_devices in platform_callbacks[device_type]:
+                async_add_devices(type_devices)
+
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Schedule a delayed refresh, coalescing requests made meanwhile."""
+        self._delayed_refresh.async_schedule_call()
+
+    @callback
+    def _async_handle_scheduled_refresh(self) -> None:
+        """Run the refresh requested by async_schedule_refresh."""
+        # The command's result must be fetched, whatever the cooldown says
+        self._force_refresh = True
+        # Tracked but not awaited by startup/shutdown, unlike a plain task
+        self.hass.async_create_background_task(
+            self.async_request_refresh(), name=f"{self.name} delayed refresh"
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending delayed refresh before shutting down."""
+        self._delayed_refresh.async_shutdown()
+        await super().async_shutdown()
+
     async def _async_update_data(self):
         """Fetch data with smart refresh logic."""
-        # Skip this update if a manual refresh happened recently
-        if time.time() - self._last_manual_refresh < self._manual_refresh_cooldown:
+        # Skip this update if a manual refresh happened recently, unless this
+        # is the scheduled refresh that fetches a command's result
+        forced = self._force_refresh
+        self._force_refresh = False
+        if (
+            not forced
+            and time.monotonic() - self._last_manual_refresh < self._manual_refresh_cooldown
+        ):
             return self.data
             
         # Get fresh data from API
         new_data = await super()._async_update_data()
+        if forced:
+            # Start the cooldown only once the manual refresh has really fetched
+            self._last_manual_refresh = time.monotonic()
         
         # If we have locked devices, preserve their state
         if self._locked_devices and new_data:
-            current_time = time.time()
-            # Remove expired locks
-            self._locked_devices = {
-                topic: end_time for topic, end_time in self._locked_devices.items()
-                if end_time > current_time
-            }
+            current_time = time.monotonic()
+            # Remove expired locks; the lock duration is fixed, so expiries
+            # are queued in order and only the head needs checking
+            expiries = self._lock_expiries
+            locked = self._locked_devices
+            while expiries and expiries[0][0] <= current_time:
+                end_time, device_id = expiries.popleft()
+                # Skip entries superseded by a newer lock on the same device
+                if locked.get(device_id) == end_time:
+                    del locked[device_id]
             
             # Restore locked device states
             if self.data and self._locked_devices:
@@ -101,34 +224,75 @@ class SmartDataUpdateCoordinator(DataUpdateCoordinator):
                     device_id = device.get("deviceID")
                     if device_id in self._locked_devices:
                         # Find the locked state from current data
-                        for old_device in self.data:
-                            if old_device.get("deviceID") == device_id:
-                                # Preserve the locked state
-                                device.update({
-                                    "msg": old_device.get("msg"),
-                                    "state": old_device.get("state", device.get("state"))
-                                })
-                                break
-        
+                        old_device = self.data_by_device_id.get(device_id)
+                        if old_device is not None:
+                            # Preserve the locked state
+                            device.update({
+                                "msg": old_device.get("msg"),
+                                "state": old_device.get("state", device.get("state"))
+                            })
+
+        # Keep a stable order so unchanged payloads compare equal and the
+        # coordinator can skip notifying listeners (always_update=False).
+        if new_data:
+            new_data.sort(key=lambda device: device.get("deviceID", ""))
+
+        # Index devices so entities, and platforms looking for their device
+        # type, can find them without scanning the whole list
+        by_device_id = {}
+        by_type = {}
+        known_device_ids = self._known_device_ids
+        for device in new_data or ():
+            # Normalize the room name to 'NFKC' form once per refresh so
+            # platforms can use it as the suggested area directly
+            room_name = device.get("room")
+            if room_name:
+                device["room"] = normalize_room(room_name)
+            device_id = device["deviceID"]
+            if device_id not in known_device_ids:
+                known_device_ids.add(device_id)
+                self._device_log.append(device)
+            by_device_id[device_id] = device
+            by_type.setdefault(device["id"], []).append(device)
+        self.data_by_device_id = by_device_id
+        self.data_by_type = by_type
+
         return new_data
 
 
+@callback
+def async_get_oauth_implementation(
+    hass: HomeAssistant,
+) -> config_entry_oauth2_flow.LocalOAuth2Implementation:
+    """Return the shared BeHome OAuth2 implementation, creating it once."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    implementation = domain_data.get("_oauth_implementation")
+    if implementation is None:
+        implementation = domain_data["_oauth_implementation"] = (
+            config_entry_oauth2_flow.LocalOAuth2Implementation(
+                hass,
+                DOMAIN,
+                OAUTH2_CLIENT_ID,
+                "",
+                OAUTH2_AUTHORIZE_URL,
+                OAUTH2_TOKEN_URL,
+            )
+        )
+    return implementation
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the BeHome component."""
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+
+    # Register the OAuth2 implementation only once per Home Assistant run
+    if domain_data.get("_oauth_registered"):
+        return True
 
     config_entry_oauth2_flow.async_register_implementation(
-        hass,
-        DOMAIN,
-        config_entry_oauth2_flow.LocalOAuth2Implementation(
-            hass,
-            DOMAIN,
-            "88ac425b4558463aa813aed1690db730",
-            "",
-            OAUTH2_AUTHORIZE_URL,
-            OAUTH2_TOKEN_URL,
-        ),
+        hass, DOMAIN, async_get_oauth_implementation(hass)
     )
+    domain_data["_oauth_registered"] = True
     return True
 
 
@@ -153,10 +317,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     coordinator = SmartDataUpdateCoordinator(
         hass,
-        DummyLogger(),
+        _LOGGER,
         name="behome_devices",
         update_method=api.get_devices,
         update_interval=SCAN_INTERVAL,
+        always_update=False,
     )
 
     await coordinator.async_config_entry_first_refresh()
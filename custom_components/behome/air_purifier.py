@@ -1,6 +1,4 @@
 """Platform for air_purifier integration."""
-import asyncio
-import unicodedata
 from typing import Any
 
 from homeassistant.components.air_purifier import (
@@ -14,6 +12,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DEVICE_TYPE_AIR_PURIFIER
 from .api import BemfaAPI
+from .util import build_device_info
 
 PRESET_MODES = ["auto", "sleep", "strong"]
 
@@ -28,36 +27,16 @@ async def async_setup_entry(
     api: BemfaAPI = domain_data["api"]
     coordinator = domain_data["coordinator"]
 
-    # Track already added device IDs
-    added_device_ids = set()
-
     @callback
-    def _async_discover_entities():
-        """Discover and add new entities."""
-        if not coordinator.data:
-            return
-        
-        devices = coordinator.data
-        ap_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_AIR_PURIFIER
-        ]
-
-        new_aps = [
-            BeHomeAirPurifier(coordinator, api, device)
-            for device in ap_devices
-            if device["deviceID"] not in added_device_ids
-        ]
-
-        if new_aps:
-            # Track the new device IDs
-            for entity in new_aps:
-                added_device_ids.add(entity._device_id)
-            async_add_entities(new_aps)
+    def _async_add_devices(devices: list[dict]) -> None:
+        """Add entities for newly seen air purifiers."""
+        async_add_entities(
+            [BeHomeAirPurifier(coordinator, api, device) for device in devices]
+        )
 
     config_entry.async_on_unload(
-        coordinator.async_add_listener(_async_discover_entities)
+        coordinator.async_register_platform((DEVICE_TYPE_AIR_PURIFIER,), _async_add_devices)
     )
-    _async_discover_entities()
 
 
 class BeHomeAirPurifier(CoordinatorEntity, AirPurifierEntity):
@@ -79,9 +58,7 @@ class BeHomeAirPurifier(CoordinatorEntity, AirPurifierEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
+        device = self.coordinator.data_by_device_id.get(self._device_id)
         if not device:
             return False
         return device.get("num", False)
@@ -89,9 +66,7 @@ class BeHomeAirPurifier(CoordinatorEntity, AirPurifierEntity):
     @property
     def _current_device_state_parts(self) -> list[str]:
         """Get the latest state for this device, split by comma."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
+        device = self.coordinator.data_by_device_id.get(self._device_id)
         return device.get("state", "").split(",") if device else []
 
     @property
@@ -109,7 +84,7 @@ class BeHomeAirPurifier(CoordinatorEntity, AirPurifierEntity):
     async def _send_command(self, msg: str):
         """Send a command to the device."""
         await self._api.control_device(self._topic, msg, self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        self.coordinator.async_schedule_refresh()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
@@ -129,18 +104,4 @@ class BeHomeAirPurifier(CoordinatorEntity, AirPurifierEntity):
     @property
     def device_info(self):
         """Return device information."""
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": "Smart Air Purifier",
-        }
-        
-        room_name = self._device.get("room")
-        if room_name:
-            # Normalize the string to 'NFKC' form to clean up potential issues
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-            pass
-        
-        return device_info
+        return build_device_info(self._device, self.name, "Smart Air Purifier")
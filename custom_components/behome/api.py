@@ -1,104 +1,151 @@
 """API client for interacting with the Bemfa Cloud."""
+import asyncio
 from typing import Any, Dict, List
-import httpx
 import base64
-import json
+
+import aiohttp
+
+# orjson ships with Home Assistant; fall back to the stdlib decoder otherwise
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
 
 from .const import API_DEVICE_LIST_URL, API_DEVICE_CONTROL_URL
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Fail fast on a stalled connection instead of holding up the poll
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+# Climate mode strings to Bemfa mode numbers, according to documentation
+_MODE_MAP = {
+    "auto": 1, "cool": 2, "heat": 3, "fan": 4,
+    "dry": 5, "sleep": 6, "eco": 7
+}
+
+# Media player remote commands passed through as-is
+_SPECIAL_COMMANDS = frozenset({"volup", "voldown", "chup", "chdown"})
+
+# Messages that always translate to the same command object
+_FIXED_COMMANDS = {
+    "on": {"on": True},
+    "off": {"on": False},
+    "stop": {"pause": True},  # Use pause for cover stop
+    **{command: {"command": command} for command in _SPECIAL_COMMANDS},
+}
+
+
+def _parse_command(message: str) -> Dict[str, Any]:
+    """Convert a parametric command string into a command object."""
+    if message.startswith("set,"):
+        # Handle brightness/temperature/speed settings
+        parts = message.split(",")
+        value = int(parts[1])
+
+        if len(parts) == 2:
+            # Simple brightness for light: "set,80" -> {"on":true,"bri":80}
+            cmd_message = {"on": True, "bri": value}
+        elif len(parts) == 4:
+            # Climate control: "set,25,cool,auto" -> {"on":true,"t":25,"mode":2}
+            mode = _MODE_MAP.get(parts[2], 1)  # Default to auto
+            cmd_message = {"on": True, "t": value, "mode": mode}
+        else:
+            # Fallback for other set commands
+            cmd_message = {"on": True, "v": value}
+
+    elif message.startswith("speed,"):
+        # Fan speed: "speed,2" -> {"on":true,"v":2}
+        speed = int(message.split(",")[1])
+        cmd_message = {"on": True, "v": speed}
+
+    else:
+        # Other commands, e.g. raw JSON payloads
+        try:
+            cmd_message = _json_loads(message)
+        except:
+            # Fallback: create a simple command object
+            cmd_message = {"on": True}
+
+    return cmd_message
+
 
 class BemfaAPI:
     """A client for the Bemfa API."""
 
-    def __init__(self, private_key: str, session: httpx.AsyncClient):
+    def __init__(self, private_key: str, session: aiohttp.ClientSession):
         """Initialize the API client."""
         self._private_key = private_key
         self._session = session
+        # The encoded key is sent with every request and never changes
+        self._openid = base64.b64encode(private_key.encode("utf-8")).decode("ascii")
+        self._devices_request: asyncio.Future | None = None
 
     async def get_devices(self) -> List[Dict[str, Any]]:
-        """Fetch all devices (topics) from the Bemfa cloud."""
-        encoded_private_key = base64.b64encode(self._private_key.encode("utf-8")).decode("utf-8")
-        params = {"openID": encoded_private_key}
+        """Fetch all devices (topics) from the Bemfa cloud.
+
+        Overlapping callers share the request that is already in flight.
+        """
+        request = self._devices_request
+        if request is None or request.done():
+            request = self._devices_request = asyncio.ensure_future(
+                self._fetch_devices()
+            )
+        return await asyncio.shield(request)
+
+    async def _fetch_devices(self) -> List[Dict[str, Any]]:
+        """Request the device list from the Bemfa cloud."""
+        params = {"openID": self._openid}
         try:
-            response = await self._session.get(API_DEVICE_LIST_URL, params=params)
-            response.raise_for_status()
-            data = await response.json()
+            async with self._session.get(
+                API_DEVICE_LIST_URL, params=params, timeout=_REQUEST_TIMEOUT
+            ) as response:
+                if response.status != 200:
+                    return []
+                data = _json_loads(await response.read())
             if data.get("code") == 0:
                 return data.get("data", {}).get("array", [])
             return []
-        except httpx.RequestError:
-            return []
-        except Exception:
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            # ValueError covers a body that is not valid JSON
             return []
 
     async def control_device(self, topic: str, message: str, device_type: int) -> bool:
-        """Send a control command to a device using the new POST endpoint."""
-        encoded_private_key = base64.b64encode(self._private_key.encode("utf-8")).decode("utf-8")
+        """Send a control command to a device using the new POST endpoint.
+
+        Every command is posted, even if an identical one is in flight, so
+        the last command sent for a topic is the one the device ends up in.
+        """
+        return await self._post_control(topic, message, device_type)
 
+    async def _post_control(self, topic: str, message: str, device_type: int) -> bool:
+        """Build and post a control command for a single topic."""
         # Parse message to JSON format - unified approach for all device types
-        if message == "on":
-            cmd_message = {"on": True}
-        elif message == "off":
-            cmd_message = {"on": False}
-        elif message.startswith("set,"):
-            # Handle brightness/temperature/speed settings
-            parts = message.split(",")
-            value = int(parts[1])
-
-            if len(parts) == 2:
-                # Simple brightness for light: "set,80" -> {"on":true,"bri":80}
-                cmd_message = {"on": True, "bri": value}
-            elif len(parts) == 4:
-                # Climate control: "set,25,cool,auto" -> {"on":true,"t":25,"mode":2}
-                temperature = value
-                mode_str = parts[2]
-                # Convert mode string to int according to documentation
-                mode_map = {
-                    "auto": 1, "cool": 2, "heat": 3, "fan": 4,
-                    "dry": 5, "sleep": 6, "eco": 7
-                }
-                mode = mode_map.get(mode_str, 1)  # Default to auto
-                cmd_message = {"on": True, "t": temperature, "mode": mode}
-            else:
-                # Fallback for other set commands
-                cmd_message = {"on": True, "v": value}
-                
-        elif message.startswith("speed,"):
-            # Fan speed: "speed,2" -> {"on":true,"v":2}
-            speed = int(message.split(",")[1])
-            cmd_message = {"on": True, "v": speed}
-            
-        else:
-            # Other commands (stop, volup, voldown, chup, chdown, etc.)
-            try:
-                # Try to parse as JSON first
-                cmd_message = json.loads(message)
-            except:
-                # Handle special commands for media player and covers
-                if message == "stop":
-                    cmd_message = {"pause": True}  # Use pause for cover stop
-                elif message in ["volup", "voldown", "chup", "chdown"]:
-                    cmd_message = {"command": message}
-                else:
-                    # Fallback: create a simple command object
-                    cmd_message = {"on": True}
+        cmd_message = _FIXED_COMMANDS.get(message)
+        if cmd_message is None:
+            cmd_message = _parse_command(message)
 
         payload = {
-            "openID": encoded_private_key,
+            "openID": self._openid,
             "topicID": topic,
             "type": device_type,
             "message": cmd_message,
         }
-        
+
         try:
-            response = await self._session.post(API_DEVICE_CONTROL_URL, json=payload)
-            response.raise_for_status()
-            data = await response.json()
+            async with self._session.post(
+                API_DEVICE_CONTROL_URL,
+                data=_json_dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=_REQUEST_TIMEOUT,
+            ) as response:
+                if response.status != 200:
+                    return False
+                data = _json_loads(await response.read())
             if data.get("code") == 0:
                 return True
             else:
                 return False
-        except httpx.RequestError:
-            return False
-        except Exception:
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            # ValueError covers a body that is not valid JSON
             return False
\ No newline at end of file
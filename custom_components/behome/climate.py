@@ -1,7 +1,7 @@
 """Platform for climate integration."""
-import asyncio
-import unicodedata
-from typing import Any, Dict, List
+from functools import lru_cache
+import logging
+from typing import Any, Dict
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -12,12 +12,19 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import UnitOfTemperature
 
 from .const import DOMAIN, DEVICE_TYPE_CLIMATE, DEVICE_TYPE_THERMOSTAT
 from .api import BemfaAPI
+from .util import build_device_info
+
+_LOGGER = logging.getLogger(__name__)
+
+# Collapse rapid changes, e.g. a dragged temperature slider, into one publish
+PUBLISH_COOLDOWN = 0.2
 
 # Map Bemfa mode numbers to Home Assistant HVAC modes
 MODE_TO_HVAC = {
@@ -38,6 +45,39 @@ PRESET_TO_MODE = {
 
 MODE_TO_PRESET = {v: k for k, v in PRESET_TO_MODE.items()}
 
+# Bound lookups for deriving state on every coordinator update
+_MODE_TO_HVAC_GET = MODE_TO_HVAC.get
+_MODE_TO_PRESET_GET = MODE_TO_PRESET.get
+
+# Map Bemfa mode numbers to the mode names used in "set" commands
+MODE_NUM_TO_CMD = {
+    1: "auto",
+    2: "cool",
+    3: "heat",
+    4: "fan",
+    5: "dry",
+    6: "sleep",
+    7: "eco",
+}
+
+
+@lru_cache(maxsize=256)
+def _build_set_cmd(temp: int, mode_str: str) -> str:
+    """Return the "set" command for a temperature and mode name."""
+    # Temperatures and modes are few, so repeated commands reuse one string
+    return f"set,{temp},{mode_str},auto"
+
+
+def _parse_temperature(value: Any) -> float | None:
+    """Convert a reported temperature to float, or None if it is not numeric."""
+    # The cloud normally reports numbers, which need no exception handling
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -49,53 +89,55 @@ async def async_setup_entry(
     api: BemfaAPI = domain_data["api"]
     coordinator = domain_data["coordinator"]
 
-    # Track already added device IDs
-    added_device_ids = set()
-
     @callback
-    def _async_discover_entities():
-        """Discover and add new entities."""
-        if not coordinator.data:
-            return
-
-        devices = coordinator.data
-
-        # Filter air conditioner devices
-        climate_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_CLIMATE
-        ]
-
-        # Filter thermostat devices
-        thermostat_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_THERMOSTAT
-        ]
-
-        new_entities = []
-
-        # Add air conditioner entities
-        for device in climate_devices:
-            if device["deviceID"] not in added_device_ids:
-                new_entities.append(BeHomeClimate(coordinator, api, device))
-                added_device_ids.add(device["deviceID"])
-
-        # Add thermostat entities
-        for device in thermostat_devices:
-            if device["deviceID"] not in added_device_ids:
-                new_entities.append(BeHomeThermostat(coordinator, api, device))
-                added_device_ids.add(device["deviceID"])
-
-        if new_entities:
-            async_add_entities(new_entities)
+    def _async_add_devices(devices: list[dict]) -> None:
+        """Add entities for newly seen climate devices."""
+        async_add_entities(
+            [
+                _DEVICE_HANDLERS[device["id"]](coordinator, api, device)
+                for device in devices
+            ]
+        )
 
     config_entry.async_on_unload(
-        coordinator.async_add_listener(_async_discover_entities)
+        coordinator.async_register_platform(_DEVICE_HANDLERS, _async_add_devices)
     )
-    _async_discover_entities()
 
 
 class BeHomeClimate(CoordinatorEntity, ClimateEntity):
     """Representation of a BeHome Climate device."""
 
+    __slots__ = (
+        "_api",
+        "_device",
+        "_topic",
+        "_device_id",
+        "_device_available",
+        "_last_mode",
+        "_last_temp",
+        "_pending_command",
+        "_publish_debouncer",
+    )
+
+    _attr_icon = "mdi:thermostat"
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_hvac_modes = (
+        HVACMode.OFF,
+        HVACMode.AUTO,
+        HVACMode.COOL,
+        HVACMode.HEAT,
+        HVACMode.FAN_ONLY,
+        HVACMode.DRY,
+    )
+    _attr_preset_modes = (PRESET_SLEEP, PRESET_ECO)
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE |
+        ClimateEntityFeature.PRESET_MODE |
+        ClimateEntityFeature.TURN_ON |
+        ClimateEntityFeature.TURN_OFF
+    )
+    _attr_target_temperature_step = 1
+
     def __init__(self, coordinator, api: BemfaAPI, device: Dict[str, Any]):
         """Initialize the climate device."""
         super().__init__(coordinator)
@@ -105,104 +147,91 @@ class BeHomeClimate(CoordinatorEntity, ClimateEntity):
         self._device_id = device["deviceID"]
         self._attr_name = device.get("name", self._topic)
         self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}"
-        self._attr_icon = "mdi:thermostat"
-        self._attr_temperature_unit = UnitOfTemperature.CELSIUS
-        self._attr_hvac_modes = [
-            HVACMode.OFF,
-            HVACMode.AUTO,
-            HVACMode.COOL,
-            HVACMode.HEAT,
-            HVACMode.FAN_ONLY,
-            HVACMode.DRY,
-        ]
-        self._attr_preset_modes = [PRESET_SLEEP, PRESET_ECO]
-        self._attr_supported_features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE |
-            ClimateEntityFeature.PRESET_MODE |
-            ClimateEntityFeature.TURN_ON |
-            ClimateEntityFeature.TURN_OFF
+        self._attr_device_info = build_device_info(
+            device,
+            self._attr_name,
+            "Smart Air Conditioner"
+            if self._topic.endswith(DEVICE_TYPE_CLIMATE)
+            else "Smart Thermostat",
         )
-        self._attr_target_temperature_step = 1
         # Store last mode and temperature for turn_on
         self._last_mode = HVACMode.COOL
         self._last_temp = 25
+        self._pending_command: str | None = None
+        self._publish_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=PUBLISH_COOLDOWN,
+            immediate=False,
+            function=self._async_flush_command,
+        )
+        self._update_from_device()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        return device.get("num", False)
-
-    @property
-    def _current_device_msg(self) -> dict:
-        """Get the latest msg for this device from the coordinator."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        msg = device.get("msg") if device else {}
-        return msg if isinstance(msg, dict) else {}
+        return self._device_available
 
-    @property
-    def hvac_mode(self) -> HVACMode | None:
-        """Return current hvac mode."""
-        msg = self._current_device_msg
-
-        # Check if device is on
-        if not msg.get("on"):
-            return HVACMode.OFF
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_device()
+        super()._handle_coordinator_update()
+
+    def _update_from_device(self) -> None:
+        """Derive the entity state from the latest device data."""
+        device = self.coordinator.data_by_device_id.get(self._device_id)
+        self._device_available = bool(device and device.get("num", False))
+        msg = device.get("msg") if device else None
+        if not isinstance(msg, dict):
+            msg = {}
 
-        # Get mode number from msg
         mode_num = msg.get("mode")
-        if mode_num is None:
-            return HVACMode.AUTO  # Default
-
-        # Check if it's a preset mode (sleep or eco)
-        if mode_num in MODE_TO_PRESET:
-            # Return the base hvac mode (auto) when in preset mode
-            return HVACMode.AUTO
+        self._attr_preset_mode = _MODE_TO_PRESET_GET(mode_num)
 
-        # Map mode number to HVAC mode
-        current_hvac_mode = MODE_TO_HVAC.get(mode_num, HVACMode.AUTO)
-
-        # Save last mode and temperature when device is on
-        if current_hvac_mode != HVACMode.OFF:
-            self._last_mode = current_hvac_mode
-            if msg.get("t"):
-                self._last_temp = msg["t"]
-
-        return current_hvac_mode
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        return self.target_temperature
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the temperature we try to reach."""
-        msg = self._current_device_msg
+        temperature = None
         if msg.get("on") and "t" in msg:
-            try:
-                return float(msg["t"])
-            except (ValueError, TypeError):
-                pass
-        return None
+            temperature = _parse_temperature(msg["t"])
+        self._attr_target_temperature = temperature
+        self._attr_current_temperature = temperature
 
-    @property
-    def preset_mode(self) -> str | None:
-        """Return the current preset mode."""
-        msg = self._current_device_msg
-        mode_num = msg.get("mode")
-        return MODE_TO_PRESET.get(mode_num)
+        # Check if device is on
+        if not msg.get("on"):
+            self._attr_hvac_mode = HVACMode.OFF
+        elif mode_num is None or mode_num in MODE_TO_PRESET:
+            # Default, or the base hvac mode (auto) when in preset mode
+            self._attr_hvac_mode = HVACMode.AUTO
+        else:
+            # Map mode number to HVAC mode
+            self._attr_hvac_mode = _MODE_TO_HVAC_GET(mode_num, HVACMode.AUTO)
+
+            # Learn the mode and temperature set on the device or in the app,
+            # so turn_on restores them; this runs once per update, not per read
+            self._last_mode = self._attr_hvac_mode
+            if temperature:
+                self._last_temp = int(temperature)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Publish any command still waiting before the entity goes away."""
+        self._publish_debouncer.async_cancel()
+        if self._pending_command is not None:
+            # Its optimistic state is already shown, so send it rather than drop it
+            await self._async_flush_command()
+        await super().async_will_remove_from_hass()
 
     async def _send_command(self, msg: str):
-        """Send a command to the climate device."""
-        await self._api.control_device(self._topic, msg, self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        """Queue a command for the climate device, keeping only the latest."""
+        self._pending_command = msg
+        self._publish_debouncer.async_schedule_call()
+
+    async def _async_flush_command(self) -> None:
+        """Publish the latest queued command."""
+        # A command queued while publishing would be dropped by the
+        # debouncer, so keep going until nothing is pending
+        while (msg := self._pending_command) is not None:
+            self._pending_command = None
+            await self._api.control_device(self._topic, msg, self._device["type"])
+        self.coordinator.async_schedule_refresh()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -216,12 +245,17 @@ class BeHomeClimate(CoordinatorEntity, ClimateEntity):
             temp = self.target_temperature or 25
             mode_num = HVAC_TO_MODE.get(hvac_mode, 1)  # Default to auto
 
+            # Remember the chosen mode and temperature for turn_on
+            self._last_mode = hvac_mode
+            self._last_temp = int(temp)
+
             # Update local state immediately
             self.coordinator.update_device_state_immediately(self._device_id, {
                 "msg": {"on": True, "t": int(temp), "mode": mode_num}
             })
 
-            await self._send_command(f"set,{int(temp)},{['auto','cool','heat','fan','dry'][mode_num-1] if mode_num <= 5 else 'auto'},auto")
+            mode_str = MODE_NUM_TO_CMD.get(mode_num, "auto")
+            await self._send_command(_build_set_cmd(int(temp), mode_str))
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -230,16 +264,21 @@ class BeHomeClimate(CoordinatorEntity, ClimateEntity):
             return
 
         # Get current mode or default to cool
-        current_mode = self.hvac_mode if self.hvac_mode != HVACMode.OFF else HVACMode.COOL
+        hvac_mode = self.hvac_mode
+        current_mode = hvac_mode if hvac_mode != HVACMode.OFF else HVACMode.COOL
         mode_num = HVAC_TO_MODE.get(current_mode, 2)  # Default to cool
 
+        # Remember the chosen mode and temperature for turn_on
+        self._last_mode = current_mode
+        self._last_temp = int(temp)
+
         # Update local state immediately
         self.coordinator.update_device_state_immediately(self._device_id, {
             "msg": {"on": True, "t": int(temp), "mode": mode_num}
         })
 
-        mode_str = ['auto','cool','heat','fan','dry'][mode_num-1] if mode_num <= 5 else 'auto'
-        await self._send_command(f"set,{int(temp)},{mode_str},auto")
+        mode_str = MODE_NUM_TO_CMD.get(mode_num, "auto")
+        await self._send_command(_build_set_cmd(int(temp), mode_str))
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode (sleep or eco)."""
@@ -248,6 +287,7 @@ class BeHomeClimate(CoordinatorEntity, ClimateEntity):
             return
 
         temp = self.target_temperature or 25
+        self._last_temp = int(temp)
 
         # Update local state immediately
         self.coordinator.update_device_state_immediately(self._device_id, {
@@ -255,8 +295,8 @@ class BeHomeClimate(CoordinatorEntity, ClimateEntity):
         })
 
         # For sleep and eco modes, send with mode number
-        mode_str = ['auto','cool','heat','fan','dry','sleep','eco'][mode_num-1]
-        await self._send_command(f"set,{int(temp)},{mode_str},auto")
+        mode_str = MODE_NUM_TO_CMD.get(mode_num, "auto")
+        await self._send_command(_build_set_cmd(int(temp), mode_str))
 
     async def async_turn_on(self) -> None:
         """Turn on the climate device (restore last mode and temperature)."""
@@ -267,8 +307,8 @@ class BeHomeClimate(CoordinatorEntity, ClimateEntity):
             "msg": {"on": True, "t": int(self._last_temp), "mode": mode_num}
         })
 
-        mode_str = ['auto','cool','heat','fan','dry'][mode_num-1] if mode_num <= 5 else 'auto'
-        await self._send_command(f"set,{int(self._last_temp)},{mode_str},auto")
+        mode_str = MODE_NUM_TO_CMD.get(mode_num, "auto")
+        await self._send_command(_build_set_cmd(int(self._last_temp), mode_str))
 
     async def async_turn_off(self) -> None:
         """Turn off the climate device."""
@@ -278,30 +318,34 @@ class BeHomeClimate(CoordinatorEntity, ClimateEntity):
         })
         await self._send_command("off")
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        model = "Smart Air Conditioner" if self._topic.endswith(DEVICE_TYPE_CLIMATE) else "Smart Thermostat"
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": model,
-        }
-        
-        room_name = self._device.get("room")
-        if room_name:
-            # Normalize the string to 'NFKC' form to clean up potential issues
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-            pass
-
-        return device_info
-
 
 class BeHomeThermostat(CoordinatorEntity, ClimateEntity):
     """Representation of a BeHome Thermostat device."""
 
+    __slots__ = (
+        "_api",
+        "_device",
+        "_topic",
+        "_device_id",
+        "_device_available",
+        "_last_temp",
+        "_pending_command",
+        "_publish_debouncer",
+    )
+
+    _attr_icon = "mdi:thermostat"
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    # Thermostat only supports OFF and HEAT modes
+    _attr_hvac_modes = (HVACMode.OFF, HVACMode.HEAT)
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE |
+        ClimateEntityFeature.TURN_ON |
+        ClimateEntityFeature.TURN_OFF
+    )
+    _attr_target_temperature_step = 1
+    _attr_min_temp = 5
+    _attr_max_temp = 35
+
     def __init__(self, coordinator, api: BemfaAPI, device: Dict[str, Any]):
         """Initialize the thermostat device."""
         super().__init__(coordinator)
@@ -311,74 +355,72 @@ class BeHomeThermostat(CoordinatorEntity, ClimateEntity):
         self._device_id = device["deviceID"]
         self._attr_name = device.get("name", self._topic)
         self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}"
-        self._attr_icon = "mdi:thermostat"
-        self._attr_temperature_unit = UnitOfTemperature.CELSIUS
-        # Thermostat only supports OFF and HEAT modes
-        self._attr_hvac_modes = [
-            HVACMode.OFF,
-            HVACMode.HEAT,
-        ]
-        self._attr_supported_features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE |
-            ClimateEntityFeature.TURN_ON |
-            ClimateEntityFeature.TURN_OFF
+        self._attr_device_info = build_device_info(
+            device, self._attr_name, "Smart Thermostat"
         )
-        self._attr_target_temperature_step = 1
-        self._attr_min_temp = 5
-        self._attr_max_temp = 35
         # Store last temperature for turn_on
         self._last_temp = 20
+        self._pending_command: str | None = None
+        self._publish_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=PUBLISH_COOLDOWN,
+            immediate=False,
+            function=self._async_flush_command,
+        )
+        self._update_from_device()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        return device.get("num", False)
+        return self._device_available
 
-    @property
-    def _current_device_msg(self) -> dict:
-        """Get the latest msg for this device from the coordinator."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        msg = device.get("msg") if device else {}
-        return msg if isinstance(msg, dict) else {}
-
-    @property
-    def hvac_mode(self) -> HVACMode | None:
-        """Return current hvac mode."""
-        msg = self._current_device_msg
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_device()
+        super()._handle_coordinator_update()
+
+    def _update_from_device(self) -> None:
+        """Derive the entity state from the latest device data."""
+        device = self.coordinator.data_by_device_id.get(self._device_id)
+        self._device_available = bool(device and device.get("num", False))
+        msg = device.get("msg") if device else None
+        if not isinstance(msg, dict):
+            msg = {}
 
         # Check if device is on
-        if not msg.get("on"):
-            return HVACMode.OFF
-
-        return HVACMode.HEAT
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        return self.target_temperature
+        self._attr_hvac_mode = HVACMode.HEAT if msg.get("on") else HVACMode.OFF
 
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the temperature we try to reach."""
-        msg = self._current_device_msg
+        temperature = None
         if "t" in msg:
-            try:
-                return float(msg["t"])
-            except (ValueError, TypeError):
-                pass
-        return self._last_temp
+            temperature = _parse_temperature(msg["t"])
+        if temperature is None:
+            temperature = self._last_temp
+        self._attr_target_temperature = temperature
+        self._attr_current_temperature = temperature
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Publish any command still waiting before the entity goes away."""
+        self._publish_debouncer.async_cancel()
+        if self._pending_command is not None:
+            # Its optimistic state is already shown, so send it rather than drop it
+            await self._async_flush_command()
+        await super().async_will_remove_from_hass()
 
     async def _send_command(self, msg: str):
-        """Send a command to the thermostat device."""
-        await self._api.control_device(self._topic, msg, self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        """Queue a command for the thermostat device, keeping only the latest."""
+        self._pending_command = msg
+        self._publish_debouncer.async_schedule_call()
+
+    async def _async_flush_command(self) -> None:
+        """Publish the latest queued command."""
+        # A command queued while publishing would be dropped by the
+        # debouncer, so keep going until nothing is pending
+        while (msg := self._pending_command) is not None:
+            self._pending_command = None
+            await self._api.control_device(self._topic, msg, self._device["type"])
+        self.coordinator.async_schedule_refresh()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -394,7 +436,7 @@ class BeHomeThermostat(CoordinatorEntity, ClimateEntity):
             self.coordinator.update_device_state_immediately(self._device_id, {
                 "msg": {"on": True, "t": int(temp)}
             })
-            await self._send_command(f"set,{int(temp)},heat,auto")
+            await self._send_command(_build_set_cmd(int(temp), "heat"))
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -409,7 +451,7 @@ class BeHomeThermostat(CoordinatorEntity, ClimateEntity):
             "msg": {"on": True, "t": int(temp)}
         })
 
-        await self._send_command(f"set,{int(temp)},heat,auto")
+        await self._send_command(_build_set_cmd(int(temp), "heat"))
 
     async def async_turn_on(self) -> None:
         """Turn on the thermostat device."""
@@ -417,7 +459,7 @@ class BeHomeThermostat(CoordinatorEntity, ClimateEntity):
         self.coordinator.update_device_state_immediately(self._device_id, {
             "msg": {"on": True, "t": int(self._last_temp)}
         })
-        await self._send_command(f"set,{int(self._last_temp)},heat,auto")
+        await self._send_command(_build_set_cmd(int(self._last_temp), "heat"))
 
     async def async_turn_off(self) -> None:
         """Turn off the thermostat device."""
@@ -427,20 +469,9 @@ class BeHomeThermostat(CoordinatorEntity, ClimateEntity):
         })
         await self._send_command("off")
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": "Smart Thermostat",
-        }
-
-        room_name = self._device.get("room")
-        if room_name:
-            # Normalize the string to 'NFKC' form to clean up potential issues
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-
-        return device_info
+
+# Air conditioners and thermostats map to their own entity classes
+_DEVICE_HANDLERS: dict[str, type[ClimateEntity]] = {
+    DEVICE_TYPE_CLIMATE: BeHomeClimate,
+    DEVICE_TYPE_THERMOSTAT: BeHomeThermostat,
+}
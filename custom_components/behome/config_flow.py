@@ -1,4 +1,5 @@
 """Config flow for BeHome integration."""
+import logging
 from typing import Any
 
 import voluptuous as vol
@@ -6,29 +7,10 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_entry_oauth2_flow
 
-from .const import (
-    DOMAIN,
-    CONF_PRIVATE_KEY,
-    OAUTH2_CLIENT_ID,
-    OAUTH2_AUTHORIZE_URL,
-    OAUTH2_TOKEN_URL,
-)
+from . import async_get_oauth_implementation
+from .const import DOMAIN, CONF_PRIVATE_KEY
 
-
-class DummyLogger:
-    """A dummy logger that does nothing."""
-    
-    def debug(self, *args, **kwargs):
-        pass
-    
-    def info(self, *args, **kwargs):
-        pass
-    
-    def warning(self, *args, **kwargs):
-        pass
-    
-    def error(self, *args, **kwargs):
-        pass
+_LOGGER = logging.getLogger(__name__)
 
 
 @config_entries.HANDLERS.register(DOMAIN)
@@ -43,22 +25,13 @@ class BeHomeConfigFlow(config_entry_oauth2_flow.AbstractOAuth2FlowHandler, domai
         hass: HomeAssistant,
     ) -> list[config_entry_oauth2_flow.AbstractOAuth2Implementation]:
         """Return a list of OAuth2 implementations."""
-        return [
-            config_entry_oauth2_flow.LocalOAuth2Implementation(
-                hass,
-                DOMAIN,
-                "88ac425b4558463aa813aed1690db730",
-                "",
-                OAUTH2_AUTHORIZE_URL,
-                OAUTH2_TOKEN_URL,
-            )
-        ]
+        return [async_get_oauth_implementation(hass)]
 
 
     @property
-    def logger(self):
-        """Return a dummy logger."""
-        return DummyLogger()
+    def logger(self) -> logging.Logger:
+        """Return logger."""
+        return _LOGGER
 
     async def async_oauth_create_entry(self, data: dict) -> dict:
         """Create an entry for the flow after successful authorization."""
@@ -1,7 +1,4 @@
 """Platform for cover integration."""
-import asyncio
-import json
-import unicodedata
 from typing import Any, Dict
 
 from homeassistant.components.cover import (
@@ -16,6 +13,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DEVICE_TYPE_COVER
 from .api import BemfaAPI
+from .util import build_device_info
 
 
 
@@ -29,37 +27,16 @@ async def async_setup_entry(
     api: BemfaAPI = domain_data["api"]
     coordinator = domain_data["coordinator"]
 
-    # Track already added device IDs
-    added_device_ids = set()
-
     @callback
-    def _async_discover_entities():
-        """Discover and add new entities."""
-        if not coordinator.data:
-            return
-
-        devices = coordinator.data
-        cover_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_COVER
-        ]
-
-        # Only create entities for new devices
-        new_covers = [
-            BeHomeCover(coordinator, api, device)
-            for device in cover_devices
-            if device["deviceID"] not in added_device_ids
-        ]
-
-        if new_covers:
-            # Track the new device IDs
-            for cover in new_covers:
-                added_device_ids.add(cover._device_id)
-            async_add_entities(new_covers)
+    def _async_add_devices(devices: list[dict]) -> None:
+        """Add entities for newly seen covers."""
+        async_add_entities(
+            [BeHomeCover(coordinator, api, device) for device in devices]
+        )
 
     config_entry.async_on_unload(
-        coordinator.async_add_listener(_async_discover_entities)
+        coordinator.async_register_platform((DEVICE_TYPE_COVER,), _async_add_devices)
     )
-    _async_discover_entities()
 
 
 class BeHomeCover(CoordinatorEntity, CoverEntity):
@@ -81,31 +58,38 @@ class BeHomeCover(CoordinatorEntity, CoverEntity):
         self._device_id = device["deviceID"]
         self._attr_name = device.get("name", self._topic)
         self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}"
+        self._attr_device_info = build_device_info(
+            device, self._attr_name, "Smart Curtain"
+        )
+
+        self._update_from_device()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        return device.get("num", False)
+        return self._device_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_device()
+        super()._handle_coordinator_update()
+
+    def _update_from_device(self) -> None:
+        """Derive the entity state from the latest device data."""
+        device = self.coordinator.data_by_device_id.get(self._device_id)
+        self._device_available = bool(device and device.get("num", False))
 
     @property
     def _current_device_state(self) -> str:
         """Get the latest state for this specific device from the coordinator."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
+        device = self.coordinator.data_by_device_id.get(self._device_id)
         return device.get("state", "closed") if device else "closed"
 
     @property
     def _current_device_msg(self) -> dict:
         """Get the latest msg for this specific device from the coordinator."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
+        device = self.coordinator.data_by_device_id.get(self._device_id)
         msg = device.get("msg") if device else {}
         return msg if isinstance(msg, dict) else {}
 
@@ -146,30 +130,33 @@ class BeHomeCover(CoordinatorEntity, CoverEntity):
         # Update local state immediately
         self.coordinator.update_device_state_immediately(self._device_id, {
             "state": "opening"
-        })
+        }, notify=False)
+        self.async_write_ha_state()
 
         await self._api.control_device(self._topic, "on", self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        self.coordinator.async_schedule_refresh()
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Instruct the cover to close."""
         # Update local state immediately
         self.coordinator.update_device_state_immediately(self._device_id, {
             "state": "closing"
-        })
+        }, notify=False)
+        self.async_write_ha_state()
 
         await self._api.control_device(self._topic, "off", self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        self.coordinator.async_schedule_refresh()
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Instruct the cover to stop."""
         # Update local state immediately
         self.coordinator.update_device_state_immediately(self._device_id, {
             "state": "stop"
-        })
+        }, notify=False)
+        self.async_write_ha_state()
 
         await self._api.control_device(self._topic, "stop", self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        self.coordinator.async_schedule_refresh()
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Move the cover to a specific position (0-100)."""
@@ -184,28 +171,11 @@ class BeHomeCover(CoordinatorEntity, CoverEntity):
         self.coordinator.update_device_state_immediately(self._device_id, {
             "msg": {"v": position},
             "state": "opening" if position > (self.current_cover_position or 0) else "closing"
-        })
+        }, notify=False)
+        self.async_write_ha_state()
 
         # Send position command in JSON format: {"on":true,"v":<position>}
-        msg = json.dumps({"on": True, "v": position})
+        # position is a clamped int, so it can be formatted in directly
+        msg = f'{{"on":true,"v":{position}}}'
         await self._api.control_device(self._topic, msg, self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": "Smart Curtain",
-        }
-        
-        room_name = self._device.get("room")
-        if room_name:
-            # Normalize the string to 'NFKC' form to clean up potential issues
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-            pass
-        
-        return device_info
+        self.coordinator.async_schedule_refresh()
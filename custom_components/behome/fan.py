@@ -1,7 +1,5 @@
 """Platform for fan integration."""
-import asyncio
 import math
-import unicodedata
 from typing import Any, Dict
 
 from homeassistant.components.fan import (
@@ -19,8 +17,12 @@ from homeassistant.util.percentage import (
 
 from .const import DOMAIN, DEVICE_TYPE_FAN
 from .api import BemfaAPI
+from .util import build_device_info
 
 SPEED_RANGE = (1, 3)
+_SPEED_COUNT = SPEED_RANGE[1] - SPEED_RANGE[0] + 1
+# Speed commands indexed by speed level
+_SPEED_CMDS = tuple(f"speed,{level}" for level in range(SPEED_RANGE[1] + 1))
 
 
 async def async_setup_entry(
@@ -33,42 +35,31 @@ async def async_setup_entry(
     api: BemfaAPI = domain_data["api"]
     coordinator = domain_data["coordinator"]
 
-    # Track already added device IDs
-    added_device_ids = set()
-
     @callback
-    def _async_discover_entities():
-        """Discover and add new entities."""
-        if not coordinator.data:
-            return
-
-        devices = coordinator.data
-        fan_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_FAN
-        ]
-
-        # Only create entities for new devices
-        new_fans = [
-            BeHomeFan(coordinator, api, device)
-            for device in fan_devices
-            if device["deviceID"] not in added_device_ids
-        ]
-
-        if new_fans:
-            # Track the new device IDs
-            for fan in new_fans:
-                added_device_ids.add(fan._device_id)
-            async_add_entities(new_fans)
+    def _async_add_devices(devices: list[dict]) -> None:
+        """Add entities for newly seen fans."""
+        async_add_entities(
+            [BeHomeFan(coordinator, api, device) for device in devices]
+        )
 
     config_entry.async_on_unload(
-        coordinator.async_add_listener(_async_discover_entities)
+        coordinator.async_register_platform((DEVICE_TYPE_FAN,), _async_add_devices)
     )
-    _async_discover_entities()
 
 
 class BeHomeFan(CoordinatorEntity, FanEntity):
     """Representation of a BeHome Fan."""
+
+    __slots__ = (
+        "_api",
+        "_device",
+        "_topic",
+        "_device_id",
+        "_device_available",
+    )
+
     _attr_icon = "mdi:fan"
+    _attr_speed_count = _SPEED_COUNT
     _attr_supported_features = (
         FanEntityFeature.SET_SPEED |
         FanEntityFeature.TURN_ON |
@@ -84,44 +75,51 @@ class BeHomeFan(CoordinatorEntity, FanEntity):
         self._device_id = device["deviceID"]
         self._attr_name = device.get("name", self._topic)
         self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}"
-        self._attr_speed_count = len(range(*SPEED_RANGE)) + 1
+        self._attr_device_info = build_device_info(
+            device, self._attr_name, "Smart Fan"
+        )
+
+        self._update_from_device()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        return device.get("num", False)
+        return self._device_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_device()
+        super()._handle_coordinator_update()
+
+    def _update_from_device(self) -> None:
+        """Derive the entity state from the latest device data."""
+        device = self.coordinator.data_by_device_id.get(self._device_id)
+        self._device_available = bool(device and device.get("num", False))
+        msg = device.get("msg") if device else None
+
+        self._attr_is_on = self._msg_is_on(msg)
+        self._attr_percentage = self._msg_percentage(msg) if self._attr_is_on else 0
 
     @property
     def is_on(self) -> bool:
         """Return true if the fan is on."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
+        # FanEntity derives is_on from the percentage, which would hide a fan
+        # that reports on with speed 0
+        return self._attr_is_on
 
-        msg = device.get("msg")
+    @staticmethod
+    def _msg_is_on(msg: Any) -> bool:
+        """Return true if a device msg reports the fan as on."""
         if isinstance(msg, dict):
             return msg.get("on") is True
 
         # Fallback for older string-based states
         return isinstance(msg, str) and msg != "off"
 
-    @property
-    def percentage(self) -> int | None:
-        """Return the current speed percentage."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device or not self.is_on:
-            return 0
-
-        msg = device.get("msg")
+    @staticmethod
+    def _msg_percentage(msg: dict | str) -> int:
+        """Return the speed percentage of a device msg for a running fan."""
         speed_val = None
 
         if isinstance(msg, dict):
@@ -131,18 +129,19 @@ class BeHomeFan(CoordinatorEntity, FanEntity):
                     speed_val = int(msg["speed"])
                 except (ValueError, TypeError):
                     pass
-        elif isinstance(msg, str) and msg.startswith("speed,"):
+        elif msg.startswith("speed,"):
             # Old string format: "speed,2"
+            _, _, speed = msg.partition(",")
             try:
-                speed_val = int(msg.split(",")[1])
-            except (ValueError, IndexError):
+                speed_val = int(speed)
+            except ValueError:
                 pass
         
         if speed_val is not None:
             return ranged_value_to_percentage(SPEED_RANGE, speed_val)
 
         # If it's on but no specific speed is found, assume a default.
-        return 66 if self.is_on else 0
+        return 66
 
     async def async_turn_on(
         self,
@@ -161,10 +160,12 @@ class BeHomeFan(CoordinatorEntity, FanEntity):
         # Update local state immediately
         self.coordinator.update_device_state_immediately(self._device_id, {
             "msg": {"on": False}
-        })
+        }, notify=False)
+        self._update_from_device()
+        self.async_write_ha_state()
 
         await self._api.control_device(self._topic, "off", self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        self.coordinator.async_schedule_refresh()
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed of the fan."""
@@ -173,30 +174,14 @@ class BeHomeFan(CoordinatorEntity, FanEntity):
             return
 
         speed_level = math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage))
-        msg = f"speed,{speed_level}"
+        msg = _SPEED_CMDS[speed_level]
 
         # Update local state immediately
         self.coordinator.update_device_state_immediately(self._device_id, {
             "msg": {"on": True, "speed": speed_level}
-        })
+        }, notify=False)
+        self._update_from_device()
+        self.async_write_ha_state()
 
         await self._api.control_device(self._topic, msg, self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": "Smart Fan",
-        }
-        
-        room_name = self._device.get("room")
-        if room_name:
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-            pass
-            
-        return device_info
+        self.coordinator.async_schedule_refresh()
@@ -1,7 +1,5 @@
 """Platform for light integration."""
-import asyncio
 from typing import Any, Dict
-import unicodedata
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -15,7 +13,13 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DEVICE_TYPE_LIGHT
 from .api import BemfaAPI
+from .util import build_device_info
 
+_BRIGHTNESS_COLOR_MODES = frozenset({ColorMode.BRIGHTNESS})
+_ONOFF_COLOR_MODES = frozenset({ColorMode.ONOFF})
+
+# Brightness commands for every 0-100 level
+_SET_CMDS = tuple(f"set,{level}" for level in range(101))
 
 
 async def async_setup_entry(
@@ -28,42 +32,30 @@ async def async_setup_entry(
     api: BemfaAPI = domain_data["api"]
     coordinator = domain_data["coordinator"]
 
-    # Track already added device IDs
-    added_device_ids = set()
-
     @callback
-    def _async_discover_entities():
-        """Discover and add new entities."""
-        if not coordinator.data:
-            return
-        
-        devices = coordinator.data
-        light_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_LIGHT
-        ]
-
-        # Create entities for all discovered devices.
-        # Home Assistant will handle matching them to existing entities.
-        new_lights = [
-            BeHomeLight(coordinator, api, device)
-            for device in light_devices
-            if device["deviceID"] not in added_device_ids
-        ]
-
-        if new_lights:
-            # Track the new device IDs
-            for entity in new_lights:
-                added_device_ids.add(entity._device_id)
-            async_add_entities(new_lights)
+    def _async_add_devices(devices: list[dict]) -> None:
+        """Add entities for newly seen lights."""
+        async_add_entities(
+            [BeHomeLight(coordinator, api, device) for device in devices]
+        )
 
     config_entry.async_on_unload(
-        coordinator.async_add_listener(_async_discover_entities)
+        coordinator.async_register_platform((DEVICE_TYPE_LIGHT,), _async_add_devices)
     )
-    _async_discover_entities()
 
 
 class BeHomeLight(CoordinatorEntity, LightEntity):
     """Representation of a BeHome Light."""
+
+    __slots__ = (
+        "_api",
+        "_device",
+        "_topic",
+        "_device_id",
+        "_device_available",
+        "_brightness_supported",
+    )
+
     _attr_icon = "mdi:lightbulb"
 
     def __init__(self, coordinator, api: BemfaAPI, device: Dict[str, Any]):
@@ -75,68 +67,50 @@ class BeHomeLight(CoordinatorEntity, LightEntity):
         self._device_id = device["deviceID"]
         self._attr_name = device.get("name", self._topic)
         self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}"
-
-    def _supports_brightness(self) -> bool:
-        """Check if device supports brightness adjustment."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
+        self._attr_device_info = build_device_info(
+            device, self._attr_name, "Smart Light"
         )
-        if not device:
-            return False
-        return device.get("attr1") is True
 
-    @property
-    def supported_color_modes(self) -> set[ColorMode]:
-        """Return supported color modes."""
-        if self._supports_brightness():
-            return {ColorMode.BRIGHTNESS}
-        return {ColorMode.ONOFF}
-
-    @property
-    def color_mode(self) -> ColorMode:
-        """Return the color mode of the light."""
-        return ColorMode.BRIGHTNESS if self._supports_brightness() else ColorMode.ONOFF
+        # Brightness support is a fixed device capability
+        self._brightness_supported = device.get("attr1") is True
+        if self._brightness_supported:
+            self._attr_supported_color_modes = _BRIGHTNESS_COLOR_MODES
+            self._attr_color_mode = ColorMode.BRIGHTNESS
+        else:
+            self._attr_supported_color_modes = _ONOFF_COLOR_MODES
+            self._attr_color_mode = ColorMode.ONOFF
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the light is on."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        
-        msg = device.get("msg")
-        if isinstance(msg, dict):
-            return msg.get("on") is True
-        
-        # Fallback for older string-based states
-        return isinstance(msg, str) and msg.startswith("on")
+        self._update_from_device()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        return device.get("num", False)
+        return self._device_available
 
-    @property
-    def brightness(self) -> int | None:
-        """Return the brightness of the light."""
-        if not self._supports_brightness():
-            return None
-            
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_device()
+        super()._handle_coordinator_update()
 
-        msg = device.get("msg")
-        
+    def _update_from_device(self) -> None:
+        """Derive the entity state from the latest device data."""
+        device = self.coordinator.data_by_device_id.get(self._device_id)
+        self._device_available = bool(device and device.get("num", False))
+        msg = device.get("msg") if device else None
+
+        if isinstance(msg, dict):
+            self._attr_is_on = msg.get("on") is True
+        else:
+            # Fallback for older string-based states
+            self._attr_is_on = isinstance(msg, str) and msg.startswith("on")
+
+        if self._brightness_supported:
+            self._attr_brightness = self._msg_brightness(msg)
+
+    @staticmethod
+    def _msg_brightness(msg: Any) -> int | None:
+        """Return the brightness reported by a device msg."""
         if isinstance(msg, dict):
             # Check if device is on
             if not msg.get("on"):
@@ -146,7 +120,7 @@ class BeHomeLight(CoordinatorEntity, LightEntity):
             if "bri" in msg:
                 try:
                     bri_val = int(msg["bri"])
-                    return int(bri_val / 100 * 255)
+                    return (bri_val * 255 + 50) // 100
                 except (ValueError, TypeError):
                     pass
             
@@ -157,10 +131,11 @@ class BeHomeLight(CoordinatorEntity, LightEntity):
                 return 0
             elif msg.startswith("on,"):
                 # Old string format: "on,80"
+                _, _, bri = msg.partition(",")
                 try:
-                    bri_val = int(msg.split(",")[1])
-                    return int(bri_val / 100 * 255)
-                except (ValueError, IndexError):
+                    bri_val = int(bri)
+                    return (bri_val * 255 + 50) // 100
+                except ValueError:
                     return 255
             elif msg == "on":
                 return 255
@@ -171,63 +146,31 @@ class BeHomeLight(CoordinatorEntity, LightEntity):
         """Instruct the light to turn on."""
         brightness = kwargs.get(ATTR_BRIGHTNESS)
         
-        if self._supports_brightness() and brightness is not None:
+        if self._brightness_supported and brightness is not None:
             # Device supports brightness and brightness was specified
-            bri_val = int(brightness / 255 * 100)
-            msg = f"set,{bri_val}"
-            
-            # Update local state immediately
-            self.coordinator.update_device_state_immediately(self._device_id, {
-                "msg": {"on": True, "bri": bri_val}
-            })
+            bri_val = (brightness * 100 + 127) // 255
+            msg = _SET_CMDS[bri_val]
+            new_msg = {"on": True, "bri": bri_val}
         else:
             # Simple on command
             msg = "on"
-            
-            # Update local state immediately
-            if self._supports_brightness():
-                # If supports brightness but no brightness specified, set to 100%
-                self.coordinator.update_device_state_immediately(self._device_id, {
-                    "msg": {"on": True}
-                })
-            else:
-                self.coordinator.update_device_state_immediately(self._device_id, {
-                    "msg": {"on": True}
-                })
-        
+            new_msg = {"on": True}
+
+        # Update local state immediately
+        self.coordinator.update_device_state_immediately(self._device_id, {
+            "msg": new_msg
+        })
+
         await self._api.control_device(self._topic, msg, self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        self.coordinator.async_schedule_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Instruct the light to turn off."""
         # Update local state immediately
-        if self._supports_brightness():
-            self.coordinator.update_device_state_immediately(self._device_id, {
-                "msg": {"on": False, "bri": 0}
-            })
-        else:
-            self.coordinator.update_device_state_immediately(self._device_id, {
-                "msg": {"on": False}
-            })
-        
-        await self._api.control_device(self._topic, "off", self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        new_msg = {"on": False, "bri": 0} if self._brightness_supported else {"on": False}
+        self.coordinator.update_device_state_immediately(self._device_id, {
+            "msg": new_msg
+        })
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": "Smart Light",
-        }
-        
-        room_name = self._device.get("room")
-        if room_name:
-            # Normalize the string to 'NFKC' form to clean up potential issues
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-            pass
-        
-        return device_info
+        await self._api.control_device(self._topic, "off", self._device["type"])
+        self.coordinator.async_schedule_refresh()
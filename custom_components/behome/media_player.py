@@ -1,6 +1,4 @@
 """Platform for media_player integration."""
-import asyncio
-import unicodedata
 from typing import Any, Dict
 
 from homeassistant.components.media_player import (
@@ -15,6 +13,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DEVICE_TYPE_MEDIA_PLAYER
 from .api import BemfaAPI
+from .util import build_device_info
 
 
 
@@ -28,41 +27,29 @@ async def async_setup_entry(
     api: BemfaAPI = domain_data["api"]
     coordinator = domain_data["coordinator"]
 
-    # Track already added device IDs
-    added_device_ids = set()
-
     @callback
-    def _async_discover_entities():
-        """Discover and add new entities."""
-        if not coordinator.data:
-            return
-        
-        devices = coordinator.data
-        mp_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_MEDIA_PLAYER
-        ]
-
-        new_mps = [
-            BeHomeMediaPlayer(coordinator, api, device)
-            for device in mp_devices
-            if device["deviceID"] not in added_device_ids
-        ]
-
-        if new_mps:
-            # Track the new device IDs
-            for entity in new_mps:
-                added_device_ids.add(entity._device_id)
-            async_add_entities(new_mps)
+    def _async_add_devices(devices: list[dict]) -> None:
+        """Add entities for newly seen media players."""
+        async_add_entities(
+            [BeHomeMediaPlayer(coordinator, api, device) for device in devices]
+        )
 
     config_entry.async_on_unload(
-        coordinator.async_add_listener(_async_discover_entities)
+        coordinator.async_register_platform((DEVICE_TYPE_MEDIA_PLAYER,), _async_add_devices)
     )
-    _async_discover_entities()
 
 
 class BeHomeMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     """Representation of a BeHome Media Player."""
 
+    __slots__ = (
+        "_api",
+        "_device",
+        "_topic",
+        "_device_id",
+        "_device_available",
+    )
+
     def __init__(self, coordinator, api: BemfaAPI, device: Dict[str, Any]):
         """Initialize the media player."""
         super().__init__(coordinator)
@@ -72,6 +59,9 @@ class BeHomeMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         self._device = device # Store device object
         self._attr_name = device.get("name", self._topic)
         self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}"
+        self._attr_device_info = build_device_info(
+            device, self._attr_name, "Smart TV"
+        )
         self._attr_icon = "mdi:television"
         self._attr_supported_features = (
             MediaPlayerEntityFeature.TURN_ON
@@ -81,33 +71,30 @@ class BeHomeMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             | MediaPlayerEntityFeature.PREVIOUS_TRACK
         )
 
+        self._update_from_device()
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        return device.get("num", False)
+        return self._device_available
 
-    @property
-    def _current_device_state(self) -> str:
-        """Get the latest state for this specific device from the coordinator."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        return device.get("state", "off") if device else "off"
-
-    @property
-    def state(self) -> MediaPlayerState:
-        """Return the state of the device."""
-        return MediaPlayerState.ON if self._current_device_state != "off" else MediaPlayerState.OFF
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_device()
+        super()._handle_coordinator_update()
+
+    def _update_from_device(self) -> None:
+        """Derive the entity state from the latest device data."""
+        device = self.coordinator.data_by_device_id.get(self._device_id)
+        self._device_available = bool(device and device.get("num", False))
+        state = device.get("state", "off") if device else "off"
+        self._attr_state = MediaPlayerState.ON if state != "off" else MediaPlayerState.OFF
 
     async def _send_command(self, msg: str):
         """Send a command to the device."""
         await self._api.control_device(self._topic, msg, self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        self.coordinator.async_schedule_refresh()
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
@@ -132,22 +119,3 @@ class BeHomeMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
         await self._send_command("chdown")
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": "Smart TV",
-        }
-        
-        room_name = self._device.get("room")
-        if room_name:
-            # Normalize the string to 'NFKC' form to clean up potential issues
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-            pass
-        
-        return device_info
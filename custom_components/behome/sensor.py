@@ -1,5 +1,5 @@
 """Platform for sensor integration."""
-import unicodedata
+from collections.abc import Iterable, Iterator
 from typing import Any, Dict
 
 from homeassistant.components.sensor import (
@@ -20,7 +20,61 @@ from homeassistant.const import (
 )
 
 from .const import DOMAIN, DEVICE_TYPE_SENSOR
+from .util import build_device_info
+
+# Multi-sensor msg keys and the sensor type each one is exposed as
+SENSOR_KEY_TO_TYPE = {
+    "t": "temperature",
+    "h": "humidity",
+    "air": "air_quality",
+    "pm25": "pm25",
+    "co2": "co2",
+    "pa": "pressure",
+}
+SENSOR_MSG_KEY = {sensor_type: key for key, sensor_type in SENSOR_KEY_TO_TYPE.items()}
+
+# Name suffix, device class and unit for each multi-sensor type
+SENSOR_TYPE_META = {
+    "temperature": ("温度", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
+    "humidity": ("湿度", SensorDeviceClass.HUMIDITY, PERCENTAGE),
+    "air_quality": ("空气质量", SensorDeviceClass.AQI, None),
+    "pm25": ("PM2.5", SensorDeviceClass.PM25, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER),
+    "co2": ("二氧化碳", SensorDeviceClass.CO2, CONCENTRATION_PARTS_PER_MILLION),
+    "pressure": ("气压", SensorDeviceClass.ATMOSPHERIC_PRESSURE, UnitOfPressure.HPA),
+}
+
+# Name keywords for single sensors, checked in order; the first match wins
+NAME_KEYWORD_META = (
+    ("temperature", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
+    ("温度", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
+    ("humidity", SensorDeviceClass.HUMIDITY, PERCENTAGE),
+    ("湿度", SensorDeviceClass.HUMIDITY, PERCENTAGE),
+    ("pm2.5", SensorDeviceClass.PM25, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER),
+    ("pm25", SensorDeviceClass.PM25, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER),
+    ("co2", SensorDeviceClass.CO2, CONCENTRATION_PARTS_PER_MILLION),
+    ("二氧化碳", SensorDeviceClass.CO2, CONCENTRATION_PARTS_PER_MILLION),
+    ("voc", SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER),
+    ("formaldehyde", SensorDeviceClass.FORMALDEHYDE, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER),
+    ("甲醛", SensorDeviceClass.FORMALDEHYDE, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER),
+)
+
 
+def _iter_sensor_ids(devices: Iterable[dict]) -> Iterator[tuple[dict, str | None, str]]:
+    """Yield (device, sensor_type, unique_id) for every entity the devices expose."""
+    for device in devices:
+        uid_prefix = f"{DOMAIN}_{device['deviceID']}"
+        msg = device.get("msg")
+        # Check if device has multi-sensor data
+        if msg and isinstance(msg, dict):
+            # Create separate entities for each sensor type
+            present = msg.keys() & SENSOR_KEY_TO_TYPE.keys()
+            # Walk the table rather than the set so entity order is stable
+            for msg_key, sensor_type in SENSOR_KEY_TO_TYPE.items():
+                if msg_key in present:
+                    yield device, sensor_type, f"{uid_prefix}_{sensor_type}"
+        else:
+            # Single sensor entity for other types
+            yield device, None, uid_prefix
 
 
 async def async_setup_entry(
@@ -41,53 +95,14 @@ async def async_setup_entry(
         if not coordinator.data:
             return
 
-        devices = coordinator.data
-        sensor_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_SENSOR
-        ]
+        sensor_devices = coordinator.data_by_type.get(DEVICE_TYPE_SENSOR, ())
 
-        new_sensors = []
-        for device in sensor_devices:
-            # Check if device has multi-sensor data
-            if device.get("msg") and isinstance(device["msg"], dict):
-                msg = device["msg"]
-                # Create separate entities for each sensor type
-                if "t" in msg:
-                    unique_id = f"{DOMAIN}_{device['deviceID']}_temperature"
-                    if unique_id not in added_unique_ids:
-                        new_sensors.append(BeHomeSensor(coordinator, device, "temperature"))
-                        added_unique_ids.add(unique_id)
-                if "h" in msg:
-                    unique_id = f"{DOMAIN}_{device['deviceID']}_humidity"
-                    if unique_id not in added_unique_ids:
-                        new_sensors.append(BeHomeSensor(coordinator, device, "humidity"))
-                        added_unique_ids.add(unique_id)
-                if "air" in msg:
-                    unique_id = f"{DOMAIN}_{device['deviceID']}_air_quality"
-                    if unique_id not in added_unique_ids:
-                        new_sensors.append(BeHomeSensor(coordinator, device, "air_quality"))
-                        added_unique_ids.add(unique_id)
-                if "pm25" in msg:
-                    unique_id = f"{DOMAIN}_{device['deviceID']}_pm25"
-                    if unique_id not in added_unique_ids:
-                        new_sensors.append(BeHomeSensor(coordinator, device, "pm25"))
-                        added_unique_ids.add(unique_id)
-                if "co2" in msg:
-                    unique_id = f"{DOMAIN}_{device['deviceID']}_co2"
-                    if unique_id not in added_unique_ids:
-                        new_sensors.append(BeHomeSensor(coordinator, device, "co2"))
-                        added_unique_ids.add(unique_id)
-                if "pa" in msg:
-                    unique_id = f"{DOMAIN}_{device['deviceID']}_pressure"
-                    if unique_id not in added_unique_ids:
-                        new_sensors.append(BeHomeSensor(coordinator, device, "pressure"))
-                        added_unique_ids.add(unique_id)
-            else:
-                # Single sensor entity for other types
-                unique_id = f"{DOMAIN}_{device['deviceID']}"
-                if unique_id not in added_unique_ids:
-                    new_sensors.append(BeHomeSensor(coordinator, device))
-                    added_unique_ids.add(unique_id)
+        new_sensors = [
+            BeHomeSensor(coordinator, device, sensor_type, unique_id)
+            for device, sensor_type, unique_id in _iter_sensor_ids(sensor_devices)
+            if unique_id not in added_unique_ids
+        ]
+        added_unique_ids.update(sensor.unique_id for sensor in new_sensors)
 
         if new_sensors:
             async_add_entities(new_sensors)
@@ -102,7 +117,13 @@ class BeHomeSensor(CoordinatorEntity, SensorEntity):
     """Representation of a BeHome Sensor."""
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def __init__(self, coordinator, device: Dict[str, Any], sensor_type: str = None):
+    def __init__(
+        self,
+        coordinator,
+        device: Dict[str, Any],
+        sensor_type: str = None,
+        unique_id: str | None = None,
+    ):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._device = device
@@ -112,121 +133,59 @@ class BeHomeSensor(CoordinatorEntity, SensorEntity):
         
         # Set name and unique ID based on sensor type
         base_name = device.get("name", self._topic)
-        if sensor_type == "temperature":
-            self._attr_name = f"{base_name} 温度"
-            self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}_temperature"
-            self._attr_device_class = SensorDeviceClass.TEMPERATURE
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        elif sensor_type == "humidity":
-            self._attr_name = f"{base_name} 湿度"
-            self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}_humidity"
-            self._attr_device_class = SensorDeviceClass.HUMIDITY
-            self._attr_native_unit_of_measurement = PERCENTAGE
-        elif sensor_type == "air_quality":
-            self._attr_name = f"{base_name} 空气质量"
-            self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}_air_quality"
-            self._attr_device_class = SensorDeviceClass.AQI
-            self._attr_native_unit_of_measurement = None
-        elif sensor_type == "pm25":
-            self._attr_name = f"{base_name} PM2.5"
-            self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}_pm25"
-            self._attr_device_class = SensorDeviceClass.PM25
-            self._attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
-        elif sensor_type == "co2":
-            self._attr_name = f"{base_name} 二氧化碳"
-            self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}_co2"
-            self._attr_device_class = SensorDeviceClass.CO2
-            self._attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
-        elif sensor_type == "pressure":
-            self._attr_name = f"{base_name} 气压"
-            self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}_pressure"
-            self._attr_device_class = SensorDeviceClass.ATMOSPHERIC_PRESSURE
-            self._attr_native_unit_of_measurement = UnitOfPressure.HPA
+        meta = SENSOR_TYPE_META.get(sensor_type)
+        if meta is not None:
+            name_suffix, device_class, unit = meta
+            self._attr_name = f"{base_name} {name_suffix}"
+            self._attr_unique_id = unique_id or f"{DOMAIN}_{self._device_id}_{sensor_type}"
+            self._attr_device_class = device_class
+            self._attr_native_unit_of_measurement = unit
         else:
             # Single sensor or other types - use original logic
             self._attr_name = base_name
-            self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}"
+            self._attr_unique_id = unique_id or f"{DOMAIN}_{self._device_id}"
             
             # Set device class and unit based on sensor name
             name_lower = self._attr_name.lower()
-            if "temperature" in name_lower or "温度" in name_lower:
-                self._attr_device_class = SensorDeviceClass.TEMPERATURE
-                self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-            elif "humidity" in name_lower or "湿度" in name_lower:
-                self._attr_device_class = SensorDeviceClass.HUMIDITY
-                self._attr_native_unit_of_measurement = PERCENTAGE
-            elif "pm2.5" in name_lower or "pm25" in name_lower:
-                self._attr_device_class = SensorDeviceClass.PM25
-                self._attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
-            elif "co2" in name_lower or "二氧化碳" in name_lower:
-                self._attr_device_class = SensorDeviceClass.CO2
-                self._attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
-            elif "voc" in name_lower:
-                self._attr_device_class = SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS
-                self._attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
-            elif "formaldehyde" in name_lower or "甲醛" in name_lower:
-                self._attr_device_class = SensorDeviceClass.FORMALDEHYDE
-                self._attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
+            for keyword, device_class, unit in NAME_KEYWORD_META:
+                if keyword in name_lower:
+                    self._attr_device_class = device_class
+                    self._attr_native_unit_of_measurement = unit
+                    break
             else:
                 self._attr_icon = "mdi:eye"
 
+        self._attr_device_info = build_device_info(
+            device, self._attr_name, "Smart Sensor"
+        )
+
+        self._update_from_device()
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        return device.get("num", False)
+        return self._device_available
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_device()
+        super()._handle_coordinator_update()
+
+    def _update_from_device(self) -> None:
+        """Derive the entity state from the latest device data."""
+        device = self.coordinator.data_by_device_id.get(self._device_id)
+        self._device_available = bool(device and device.get("num", False))
         if not device:
-            return None
-            
-        # Handle multi-sensor devices
-        if self._sensor_type == "temperature":
-            msg = device.get("msg", {})
-            return msg.get("t") if isinstance(msg, dict) else None
-        elif self._sensor_type == "humidity":
-            msg = device.get("msg", {})
-            return msg.get("h") if isinstance(msg, dict) else None
-        elif self._sensor_type == "air_quality":
-            msg = device.get("msg", {})
-            return msg.get("air") if isinstance(msg, dict) else None
-        elif self._sensor_type == "pm25":
-            msg = device.get("msg", {})
-            return msg.get("pm25") if isinstance(msg, dict) else None
-        elif self._sensor_type == "co2":
-            msg = device.get("msg", {})
-            return msg.get("co2") if isinstance(msg, dict) else None
-        elif self._sensor_type == "pressure":
-            msg = device.get("msg", {})
-            return msg.get("pa") if isinstance(msg, dict) else None
-        else:
+            self._attr_native_value = None
+            return
+
+        msg_key = SENSOR_MSG_KEY.get(self._sensor_type)
+        if msg_key is None:
             # Single sensor - use original logic
-            return device.get("state")
+            self._attr_native_value = device.get("state")
+            return
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": "Smart Sensor",
-        }
-        
-        room_name = self._device.get("room")
-        if room_name:
-            # Normalize the string to 'NFKC' form to clean up potential issues
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-            pass
-        
-        return device_info
+        # Multi-sensor devices report each reading under its own msg key
+        msg = device.get("msg")
+        self._attr_native_value = msg.get(msg_key) if isinstance(msg, dict) else None
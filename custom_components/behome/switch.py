@@ -1,7 +1,5 @@
 """Platform for switch integration."""
-import asyncio
 from typing import Any, Dict
-import unicodedata
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
 from homeassistant.config_entries import ConfigEntry
@@ -11,6 +9,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, DEVICE_TYPE_SOCKET, DEVICE_TYPE_SWITCH
 from .api import BemfaAPI
+from .util import build_device_info
 
 
 
@@ -24,48 +23,19 @@ async def async_setup_entry(
     api: BemfaAPI = domain_data["api"]
     coordinator = domain_data["coordinator"]
 
-    # Track already added device IDs
-    added_device_ids = set()
-
     @callback
-    def _async_discover_entities():
-        """Discover and add new entities."""
-        if not coordinator.data:
-            return
-
-        devices = coordinator.data
-
-        # Separate devices into sockets and switches
-        socket_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_SOCKET
-        ]
-        switch_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_SWITCH
-        ]
-
-        new_entities = []
-
-        # Create socket entities
-        for device in socket_devices:
-            if device["deviceID"] not in added_device_ids:
-                new_entities.append(BeHomeSocket(coordinator, api, device))
-                added_device_ids.add(device["deviceID"])
-
-        # Create generic switch entities
-        for device in switch_devices:
-            if device["deviceID"] not in added_device_ids:
-                new_entities.append(BeHomeSwitch(coordinator, api, device))
-                added_device_ids.add(device["deviceID"])
-
-        if new_entities:
-            async_add_entities(new_entities)
-
-    # Run the discovery function whenever the coordinator has new data.
+    def _async_add_devices(devices: list[dict]) -> None:
+        """Add entities for newly seen sockets and switches."""
+        async_add_entities(
+            [
+                _DEVICE_HANDLERS[device["id"]](coordinator, api, device)
+                for device in devices
+            ]
+        )
+
     config_entry.async_on_unload(
-        coordinator.async_add_listener(_async_discover_entities)
+        coordinator.async_register_platform(_DEVICE_HANDLERS, _async_add_devices)
     )
-    # And run it once now
-    _async_discover_entities()
 
 
 class BeHomeSwitch(CoordinatorEntity, SwitchEntity):
@@ -81,32 +51,34 @@ class BeHomeSwitch(CoordinatorEntity, SwitchEntity):
         self._device_id = device["deviceID"]
         self._attr_name = device.get("name", self._topic)
         self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}"
+        self._attr_device_info = build_device_info(
+            device, self._attr_name, "Smart Switch"
+        )
+
+        self._update_from_device()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        return device.get("num", False)
+        return self._device_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_device()
+        super()._handle_coordinator_update()
+
+    def _update_from_device(self) -> None:
+        """Derive the entity state from the latest device data."""
+        device = self.coordinator.data_by_device_id.get(self._device_id)
+        self._device_available = bool(device and device.get("num", False))
+        msg = device.get("msg") if device else None
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        
-        msg = device.get("msg")
         if isinstance(msg, dict):
-            return msg.get("on") is True
-        
-        # Fallback for older or unexpected string-based states
-        return msg == "on"
+            self._attr_is_on = msg.get("on") is True
+        else:
+            # Fallback for older or unexpected string-based states
+            self._attr_is_on = msg == "on"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Instruct the switch to turn on."""
@@ -116,7 +88,7 @@ class BeHomeSwitch(CoordinatorEntity, SwitchEntity):
         })
         
         await self._api.control_device(self._topic, "on", self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        self.coordinator.async_schedule_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Instruct the switch to turn off."""
@@ -126,25 +98,7 @@ class BeHomeSwitch(CoordinatorEntity, SwitchEntity):
         })
         
         await self._api.control_device(self._topic, "off", self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": "Smart Switch",
-        }
-        
-        room_name = self._device.get("room")
-        if room_name:
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-            pass
-            
-        return device_info
+        self.coordinator.async_schedule_refresh()
 
 
 class BeHomeSocket(BeHomeSwitch):
@@ -155,10 +109,10 @@ class BeHomeSocket(BeHomeSwitch):
         """Initialize the socket."""
         super().__init__(coordinator, api, device)
         self._attr_icon = "mdi:power-socket-eu" # Or other appropriate socket icon
-        
-    @property
-    def device_info(self):
-        """Return device information for the socket."""
-        info = super().device_info
-        info["model"] = "Smart Socket"
-        return info
+        self._attr_device_info["model"] = "Smart Socket"
+
+
+_DEVICE_HANDLERS: dict[str, type[SwitchEntity]] = {
+    DEVICE_TYPE_SOCKET: BeHomeSocket,
+    DEVICE_TYPE_SWITCH: BeHomeSwitch,
+}
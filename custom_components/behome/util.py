@@ -0,0 +1,36 @@
+"""Helpers shared by the BeHome platforms."""
+from functools import lru_cache
+from typing import Any, Dict
+import unicodedata
+
+from .const import DOMAIN
+
+
+@lru_cache(maxsize=256)
+def normalize_room(room_name: str) -> str:
+    """Return a room name in 'NFKC' form with surrounding whitespace removed.
+
+    Homes have few distinct rooms, so repeat names are served from the cache.
+    """
+    # ASCII is always NFKC, and most other names already are, so only
+    # names that fail both checks go through the full rebuild
+    if not room_name.isascii() and not unicodedata.is_normalized("NFKC", room_name):
+        room_name = unicodedata.normalize("NFKC", room_name)
+    return room_name.strip()
+
+
+def build_device_info(device: Dict[str, Any], name: str, model: str) -> dict:
+    """Return device registry information for a BeHome device."""
+    device_info = {
+        "identifiers": frozenset({(DOMAIN, device["deviceID"])}),
+        "name": name,
+        "manufacturer": "BeHome (Bemfa)",
+        "model": model,
+    }
+
+    # The coordinator has already normalized the room name
+    room_name = device.get("room")
+    if room_name:
+        device_info["suggested_area"] = room_name
+
+    return device_info
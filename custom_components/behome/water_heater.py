@@ -1,6 +1,5 @@
 """Platform for water_heater integration."""
-import asyncio
-import unicodedata
+from functools import lru_cache
 from typing import Any, Dict
 
 from homeassistant.components.water_heater import (
@@ -18,6 +17,7 @@ from homeassistant.const import UnitOfTemperature, ATTR_TEMPERATURE
 
 from .const import DOMAIN, DEVICE_TYPE_WATER_HEATER
 from .api import BemfaAPI
+from .util import build_device_info
 
 
 HA_OP_MODE_TO_BEMFA = {
@@ -27,6 +27,17 @@ HA_OP_MODE_TO_BEMFA = {
 }
 BEMFA_OP_MODE_TO_HA = {v: k for k, v in HA_OP_MODE_TO_BEMFA.items()}
 
+# Bound lookups for the property and command paths
+_HA_OP_MODE_TO_BEMFA_GET = HA_OP_MODE_TO_BEMFA.get
+_BEMFA_OP_MODE_TO_HA_GET = BEMFA_OP_MODE_TO_HA.get
+
+
+@lru_cache(maxsize=256)
+def _build_set_cmd(temp: int, mode_bemfa: str) -> str:
+    """Return the "set" command for a temperature and Bemfa mode."""
+    # Temperatures and modes are few, so repeated commands reuse one string
+    return f"set,{temp},{mode_bemfa}"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -38,36 +49,16 @@ async def async_setup_entry(
     api: BemfaAPI = domain_data["api"]
     coordinator = domain_data["coordinator"]
 
-    # Track already added device IDs
-    added_device_ids = set()
-
     @callback
-    def _async_discover_entities():
-        """Discover and add new entities."""
-        if not coordinator.data:
-            return
-        
-        devices = coordinator.data
-        wh_devices = [
-            device for device in devices if device["id"] == DEVICE_TYPE_WATER_HEATER
-        ]
-
-        new_whs = [
-            BeHomeWaterHeater(coordinator, api, device)
-            for device in wh_devices
-            if device["deviceID"] not in added_device_ids
-        ]
-
-        if new_whs:
-            # Track the new device IDs
-            for entity in new_whs:
-                added_device_ids.add(entity._device_id)
-            async_add_entities(new_whs)
+    def _async_add_devices(devices: list[dict]) -> None:
+        """Add entities for newly seen water heaters."""
+        async_add_entities(
+            [BeHomeWaterHeater(coordinator, api, device) for device in devices]
+        )
 
     config_entry.async_on_unload(
-        coordinator.async_add_listener(_async_discover_entities)
+        coordinator.async_register_platform((DEVICE_TYPE_WATER_HEATER,), _async_add_devices)
     )
-    _async_discover_entities()
 
 
 class BeHomeWaterHeater(CoordinatorEntity, WaterHeaterEntity):
@@ -89,49 +80,51 @@ class BeHomeWaterHeater(CoordinatorEntity, WaterHeaterEntity):
         self._device_id = device["deviceID"]
         self._attr_name = device.get("name", self._topic)
         self._attr_unique_id = f"{DOMAIN}_{device['deviceID']}"
+        self._attr_device_info = build_device_info(
+            device, self._attr_name, "Smart Water Heater"
+        )
+
+        self._update_from_device()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        if not device:
-            return False
-        return device.get("num", False)
+        return self._device_available
 
-    @property
-    def _current_device_state_parts(self) -> list[str]:
-        """Get the latest state for this device, split by comma."""
-        device = next(
-            (d for d in self.coordinator.data if d["deviceID"] == self._device_id), None
-        )
-        return device.get("state", "").split(",") if device else []
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_device()
+        super()._handle_coordinator_update()
+
+    def _update_from_device(self) -> None:
+        """Derive the entity state from the latest device data."""
+        device = self.coordinator.data_by_device_id.get(self._device_id)
+        self._device_available = bool(device and device.get("num", False))
+        # The state is "on,<temp>,<mode>" or "off"; split it once per update
+        parts = device.get("state", "").split(",") if device else []
 
-    @property
-    def current_operation(self) -> str | None:
-        """Return current operation."""
-        parts = self._current_device_state_parts
         if not parts or parts[0] == "off":
-            return STATE_OFF
-        
-        return BEMFA_OP_MODE_TO_HA.get(parts[2]) if len(parts) > 2 else STATE_PERFORMANCE
+            self._attr_current_operation = STATE_OFF
+            self._attr_target_temperature = None
+            return
 
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the temperature we try to reach."""
-        parts = self._current_device_state_parts
-        if len(parts) > 1 and parts[0] != "off":
+        self._attr_current_operation = (
+            _BEMFA_OP_MODE_TO_HA_GET(parts[2]) if len(parts) > 2 else STATE_PERFORMANCE
+        )
+
+        temperature = None
+        if len(parts) > 1:
             try:
-                return float(parts[1])
-            except (ValueError, IndexError):
+                temperature = float(parts[1])
+            except ValueError:
                 pass
-        return None
+        self._attr_target_temperature = temperature
 
     async def _send_command(self, msg: str):
         """Send a command to the device."""
         await self._api.control_device(self._topic, msg, self._device["type"])
-        asyncio.create_task(self.coordinator.async_request_refresh_after_delay(3.0))
+        self.coordinator.async_schedule_refresh()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -139,9 +132,10 @@ class BeHomeWaterHeater(CoordinatorEntity, WaterHeaterEntity):
         if temp is None:
             return
         
-        mode = self.current_operation if self.current_operation != STATE_OFF else STATE_PERFORMANCE
-        mode_bemfa = HA_OP_MODE_TO_BEMFA.get(mode, "perf")
-        await self._send_command(f"set,{int(temp)},{mode_bemfa}")
+        current_operation = self.current_operation
+        mode = current_operation if current_operation != STATE_OFF else STATE_PERFORMANCE
+        mode_bemfa = _HA_OP_MODE_TO_BEMFA_GET(mode, "perf")
+        await self._send_command(_build_set_cmd(int(temp), mode_bemfa))
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new target operation mode."""
@@ -149,24 +143,5 @@ class BeHomeWaterHeater(CoordinatorEntity, WaterHeaterEntity):
             await self._send_command("off")
         else:
             temp = self.target_temperature or 55
-            mode_bemfa = HA_OP_MODE_TO_BEMFA.get(operation_mode, "perf")
-            await self._send_command(f"set,{int(temp)},{mode_bemfa}")
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_info = {
-            "identifiers": {(DOMAIN, self._device['deviceID'])},
-            "name": self.name,
-            "manufacturer": "BeHome (Bemfa)",
-            "model": "Smart Water Heater",
-        }
-        
-        room_name = self._device.get("room")
-        if room_name:
-            # Normalize the string to 'NFKC' form to clean up potential issues
-            normalized_room_name = unicodedata.normalize("NFKC", room_name).strip()
-            device_info["suggested_area"] = normalized_room_name
-            pass
-        
-        return device_info
+            mode_bemfa = _HA_OP_MODE_TO_BEMFA_GET(operation_mode, "perf")
+            await self._send_command(_build_set_cmd(int(temp), mode_bemfa))